@@ -12,110 +12,292 @@ import urllib.error
 import sys
 import ssl
 import re
-from datetime import datetime
+import time
+import threading
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 
-# The signals AI search engines use to decide whether to cite your content
+# Matched against the lowercased page, so no IGNORECASE needed
+HEADING_START = re.compile(rb'<h[123]')
+
+
+def has_heading(hl: bytes) -> bool:
+    # Same result as searching for <h[123][^>]*>, which matches exactly when the
+    # first <h1/<h2/<h3 has a '>' somewhere after it. Searching that regex
+    # directly backtracks quadratically on pages full of unclosed '<h1 '.
+    m = HEADING_START.search(hl)
+    return bool(m) and hl.find(b'>', m.end()) != -1
+
+
+# The signals AI search engines use to decide whether to cite your content.
+# "keywords" signals pass if any keyword appears in the lowercased page
+# (their "check" is generated below); the rest use a hand-written "check".
+# Checks are called with the lowercased page as raw bytes (every token we
+# look for is ASCII), so keywords are bytes too.
 AI_SEO_SIGNALS = {
     "Schema Markup (JSON-LD)": {
-        "check": lambda h: 'application/ld+json' in h,
+        "keywords": (b'application/ld+json',),
         "why": "AI engines use structured data to understand entities and facts",
         "weight": 15,
     },
     "Author / Expertise signal": {
-        "check": lambda h: any(x in h.lower() for x in ['author', 'byline', 'written by', '"author"', 'rel="author"']),
+        # 'author' also covers '"author"' and 'rel="author"'
+        "keywords": (b'author', b'byline', b'written by'),
         "why": "E-E-A-T: AI prefers content with identifiable authors",
         "weight": 10,
     },
     "FAQ or Q&A content": {
-        "check": lambda h: any(x in h.lower() for x in ['faqpage', 'faq', 'frequently asked', 'question', '"@type": "question"']),
+        # 'faq' also covers 'faqpage', 'question' covers '"@type": "question"'
+        "keywords": (b'faq', b'frequently asked', b'question'),
         "why": "AI engines love extracting Q&A pairs as direct answers",
         "weight": 10,
     },
     "Heading structure (H1/H2/H3)": {
-        "check": lambda h: bool(re.search(r'<h[123][^>]*>', h, re.IGNORECASE)),
+        "check": has_heading,
         "why": "Clear hierarchy helps AI parse and chunk your content",
         "weight": 8,
     },
     "Meta description": {
-        "check": lambda h: 'name="description"' in h.lower() or "name='description'" in h.lower(),
+        "keywords": (b'name="description"', b"name='description'"),
         "why": "Used as fallback summary when AI cites your page",
         "weight": 8,
     },
     "Open Graph tags": {
-        "check": lambda h: 'property="og:' in h.lower() or "property='og:" in h.lower(),
+        "keywords": (b'property="og:', b"property='og:"),
         "why": "Helps AI engines identify canonical title and description",
         "weight": 7,
     },
     "Canonical URL tag": {
-        "check": lambda h: 'rel="canonical"' in h.lower() or "rel='canonical'" in h.lower(),
+        "keywords": (b'rel="canonical"', b"rel='canonical'"),
         "why": "Prevents AI from citing duplicate/wrong version of your page",
         "weight": 7,
     },
     "HTTPS / Secure connection": {
-        "check": lambda h: True,  # checked separately
+        "check": lambda hl: True,  # checked separately
         "why": "AI engines deprioritize non-secure sources",
         "weight": 8,
     },
     "robots.txt present": {
-        "check": lambda h: True,  # checked separately
+        "check": lambda hl: True,  # checked separately
         "why": "Signals a technically maintained, crawlable website",
         "weight": 5,
     },
     "sitemap.xml present": {
-        "check": lambda h: True,  # checked separately
+        "check": lambda hl: True,  # checked separately
         "why": "Helps AI crawlers discover all your content efficiently",
         "weight": 7,
     },
     "Fast response (<2s)": {
-        "check": lambda h: True,  # checked separately
+        "check": lambda hl: True,  # checked separately
         "why": "Slow sites get deprioritized in AI-driven search ranking",
         "weight": 8,
     },
     "Viewport / Mobile-friendly": {
-        "check": lambda h: 'name="viewport"' in h.lower() or "name='viewport'" in h.lower(),
+        "keywords": (b'name="viewport"', b"name='viewport'"),
         "why": "Mobile-first indexing affects AI crawl priority",
         "weight": 7,
     },
 }
 
 
-def fetch_url(url: str, timeout: int = 12):
-    req = urllib.request.Request(
-        url,
-        headers={"User-Agent": "AISEOReadinessChecker/1.0 (https://aiseoscan.dev)"}
-    )
-    ctx = ssl.create_default_context()
-    return urllib.request.urlopen(req, context=ctx, timeout=timeout)
+def keyword_check(keywords: tuple):
+    """Generate check(hl) as a straight-line `or` chain over the keywords."""
+    src = "def check(hl):\n    return " + " or ".join(f"{k!r} in hl" for k in keywords) + "\n"
+    namespace = {}
+    exec(src, namespace)
+    return namespace["check"]
+
+
+for _signal in AI_SEO_SIGNALS.values():
+    if "keywords" in _signal:
+        _signal["check"] = keyword_check(_signal["keywords"])
+del _signal
+
+
+# Every signal is always scored, so the denominator is fixed
+TOTAL_WEIGHT = sum(s["weight"] for s in AI_SEO_SIGNALS.values())
+
+# Signals that don't come from the page HTML
+SEPARATE_CHECKS = ("HTTPS / Secure connection", "robots.txt present", "sitemap.xml present", "Fast response (<2s)")
+
+# The page is read and checked in chunks so we can stop once every signal passed.
+# Each chunk is checked together with the last CHUNK_OVERLAP bytes before
+# it, so keywords split across two chunks are still found.
+CHUNK_SIZE = 16 * 1024
+CHUNK_OVERLAP = 1024
+
+# Stop reading past this many (decompressed) bytes, so a gzip bomb or an
+# endless page can't exhaust memory
+MAX_PAGE_SIZE = 10 * 1024 * 1024
+
+# Repeat analyses of a domain within CACHE_TTL_S of the first reuse its result.
+# RESULT_CACHE maps domain -> (time analyzed, results), least recently used first.
+CACHE_TTL_S = 15 * 60
+CACHE_SIZE = 1024
+RESULT_CACHE = OrderedDict()
+CACHE_LOCK = threading.Lock()
+
+# Domains analyzed at once in --batch mode
+BATCH_CONCURRENCY = 50
+
+
+class KeepHeadRedirectHandler(urllib.request.HTTPRedirectHandler):
+    """Follow redirects without turning a HEAD request into a full GET."""
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        new_req = super().redirect_request(req, fp, code, msg, headers, newurl)
+        if new_req is not None and req.get_method() == "HEAD":
+            new_req.method = "HEAD"
+        return new_req
+
+
+# Built once and shared by every request (urlopen builds a new opener per call,
+# and each connection would otherwise load the system CA bundle again)
+SSL_CONTEXT = ssl.create_default_context()
+OPENER = urllib.request.build_opener(
+    urllib.request.HTTPSHandler(context=SSL_CONTEXT),
+    KeepHeadRedirectHandler(),
+)
+OPENER.addheaders = [
+    ("User-Agent", "AISEOReadinessChecker/1.0 (https://aiseoscan.dev)"),
+    ("Accept-Encoding", "gzip"),
+]
+
+
+def fetch_url(url: str, timeout: int = 12, method: str = "GET", headers: dict = None):
+    req = urllib.request.Request(url, headers=headers or {}, method=method)
+    return OPENER.open(req, timeout=timeout)
+
+
+def scan_html(r) -> dict:
+    """Read a page response chunk by chunk and return {signal name: passed}.
+
+    Reading stops early once every HTML-based signal has passed.
+    """
+    pending = {n: s for n, s in AI_SEO_SIGNALS.items() if n not in SEPARATE_CHECKS}
+    found = set()
+    html_lower = bytearray()
+    start = 0
+    gzipped = r.headers.get("Content-Encoding", "").strip().lower() == "gzip"
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS) if gzipped else None
+
+    while pending and len(html_lower) < MAX_PAGE_SIZE:
+        if decompressor:
+            # Inflate at most CHUNK_SIZE bytes per step; the rest of the
+            # compressed input waits in unconsumed_tail for the next one
+            compressed = decompressor.unconsumed_tail or r.read(CHUNK_SIZE)
+            if not compressed:
+                break
+            data = decompressor.decompress(compressed, CHUNK_SIZE)
+        else:
+            data = r.read(CHUNK_SIZE)
+            if not data:
+                break
+        start = max(0, len(html_lower) - CHUNK_OVERLAP)
+        html_lower += data.lower()
+        window = bytes(html_lower[start:])
+
+        for name, signal in list(pending.items()):
+            if signal["check"](window):
+                found.add(name)
+                del pending[name]
+
+    # A hand-written check's match may span more than CHUNK_OVERLAP, so
+    # give the remaining ones one pass over the whole page
+    if start > 0:
+        for name, signal in pending.items():
+            if "keywords" not in signal and signal["check"](bytes(html_lower)):
+                found.add(name)
+
+    return {name: name in found for name in AI_SEO_SIGNALS if name not in SEPARATE_CHECKS}
+
+
+def fetch_page(url: str):
+    """Fetch and scan a page, returning ({signal name: passed}, seconds until the response arrived)."""
+    start = time.perf_counter()
+    with fetch_url(url) as r:
+        elapsed = time.perf_counter() - start
+        return scan_html(r), elapsed
+
+
+def url_exists(url: str) -> bool:
+    """Check that a URL responds with 200, without downloading its body."""
+    try:
+        with fetch_url(url, timeout=8, method="HEAD") as r:
+            return r.status == 200
+    except urllib.error.HTTPError as e:
+        e.close()
+        if e.code not in (405, 501):
+            return False
+
+    # Some servers reject HEAD, so ask for just the first byte instead
+    try:
+        with fetch_url(url, timeout=8, headers={"Range": "bytes=0-0"}) as r:
+            return r.status in (200, 206)
+    except urllib.error.HTTPError as e:
+        e.close()
+        # 416: the file exists but is empty, so it has no first byte
+        return e.code == 416
 
 
 def analyze_site(domain: str) -> dict:
+    """Analyze a domain's AI SEO signals.
+
+    Results are cached per domain for CACHE_TTL_S seconds after they were
+    fetched and shared between callers, so treat them as read-only. Call
+    analyze_site.cache_clear() to force fresh fetches.
+    """
     domain = domain.replace("https://", "").replace("http://", "").strip("/")
+    # Host names are case-insensitive; anything after them isn't
+    host, slash, path = domain.partition("/")
+    domain = host.lower() + slash + path
+
+    with CACHE_LOCK:
+        cached = RESULT_CACHE.get(domain)
+        if cached and time.monotonic() - cached[0] < CACHE_TTL_S:
+            RESULT_CACHE.move_to_end(domain)
+            return cached[1]
+
+    fetched_at = time.monotonic()
+    results = _analyze_site(domain)
+
+    with CACHE_LOCK:
+        RESULT_CACHE[domain] = (fetched_at, results)
+        RESULT_CACHE.move_to_end(domain)
+        while len(RESULT_CACHE) > CACHE_SIZE:
+            RESULT_CACHE.popitem(last=False)
+    return results
+
+
+def _analyze_site(domain: str) -> dict:
     base_url = f"https://{domain}"
     results = {"domain": domain, "signals": {}, "meta": {}}
 
-    # Fetch main page
+    # Fetch main page, robots.txt and sitemap.xml concurrently
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        page = pool.submit(fetch_page, base_url)
+        extras = [
+            (key, pool.submit(url_exists, base_url + path))
+            for path, key in [("/robots.txt", "robots.txt present"), ("/sitemap.xml", "sitemap.xml present")]
+        ]
+
     try:
-        start = datetime.now()
-        with fetch_url(base_url) as r:
-            elapsed = (datetime.now() - start).total_seconds()
-            html = r.read().decode("utf-8", errors="ignore")
-            results["meta"]["live"] = True
-            results["meta"]["has_ssl"] = True
-            results["meta"]["response_time_s"] = round(elapsed, 2)
-            results["meta"]["fast"] = elapsed < 2.0
+        html_signals, elapsed = page.result()
+        results["meta"]["live"] = True
+        results["meta"]["has_ssl"] = True
+        results["meta"]["response_time_s"] = round(elapsed, 2)
+        results["meta"]["fast"] = elapsed < 2.0
     except Exception as e:
-        print(f"  ❌ Could not reach {base_url}: {e}")
-        sys.exit(1)
+        raise ConnectionError(f"Could not reach {base_url}: {e}") from e
 
     # HTML-based checks
-    for name, signal in AI_SEO_SIGNALS.items():
-        if name in ("HTTPS / Secure connection", "robots.txt present", "sitemap.xml present", "Fast response (<2s)"):
-            continue
+    for name, passed in html_signals.items():
         results["signals"][name] = {
-            "passed": signal["check"](html),
-            "why": signal["why"],
-            "weight": signal["weight"],
+            "passed": passed,
+            "why": AI_SEO_SIGNALS[name]["why"],
+            "weight": AI_SEO_SIGNALS[name]["weight"],
         }
 
     # Separate checks
@@ -130,10 +312,9 @@ def analyze_site(domain: str) -> dict:
         "weight": 8,
     }
 
-    for path, key in [("/robots.txt", "robots.txt present"), ("/sitemap.xml", "sitemap.xml present")]:
+    for key, future in extras:
         try:
-            with fetch_url(base_url + path, timeout=8) as r:
-                passed = r.status == 200
+            passed = future.result()
         except Exception:
             passed = False
         results["signals"][key] = {
@@ -143,14 +324,37 @@ def analyze_site(domain: str) -> dict:
         }
 
     # Weighted score
-    total_weight = sum(s["weight"] for s in results["signals"].values())
     earned_weight = sum(s["weight"] for s in results["signals"].values() if s["passed"])
-    results["meta"]["score"] = int((earned_weight / total_weight) * 100)
+    results["meta"]["score"] = int((earned_weight / TOTAL_WEIGHT) * 100)
 
     return results
 
 
-def print_report(results: dict):
+def cache_clear():
+    with CACHE_LOCK:
+        RESULT_CACHE.clear()
+
+
+analyze_site.cache_clear = cache_clear
+
+
+def analyze_batch(domains: list, concurrency: int = BATCH_CONCURRENCY):
+    """Analyze many domains concurrently.
+
+    Yields (domain, results) in input order; results is the exception
+    instead if that domain couldn't be analyzed.
+    """
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [(domain, pool.submit(analyze_site, domain)) for domain in domains]
+        for domain, future in futures:
+            try:
+                yield domain, future.result()
+            except Exception as e:
+                yield domain, e
+
+
+def format_report(results: dict) -> str:
+    lines = []
     domain = results["domain"]
     score = results["meta"]["score"]
     signals = results["signals"]
@@ -175,62 +379,100 @@ def print_report(results: dict):
         verdict = "Poor — significant AI SEO gaps detected"
         color = "🔴"
 
-    print(f"\n{'='*62}")
-    print(f"  🤖 AI SEO Readiness Report")
-    print(f"  Site: {domain}")
-    print(f"  Response time: {results['meta']['response_time_s']}s")
-    print(f"{'='*62}")
+    lines.append(f"\n{'='*62}")
+    lines.append(f"  🤖 AI SEO Readiness Report")
+    lines.append(f"  Site: {domain}")
+    lines.append(f"  Response time: {results['meta']['response_time_s']}s")
+    lines.append(f"{'='*62}")
 
-    print(f"\n  AI READINESS SCORE: {score}/100  |  Grade: {grade}  {color}")
-    print(f"  {verdict}")
+    lines.append(f"\n  AI READINESS SCORE: {score}/100  |  Grade: {grade}  {color}")
+    lines.append(f"  {verdict}")
 
-    print(f"\n{'─'*62}")
-    print(f"  SIGNALS DETECTED  ({len(passed)}/{len(signals)} passing)")
-    print(f"{'─'*62}")
+    lines.append(f"\n{'─'*62}")
+    lines.append(f"  SIGNALS DETECTED  ({len(passed)}/{len(signals)} passing)")
+    lines.append(f"{'─'*62}")
     for name, signal in passed:
-        print(f"  ✅ {name}")
+        lines.append(f"  ✅ {name}")
 
     if failed:
-        print(f"\n{'─'*62}")
-        print(f"  MISSING SIGNALS  — AI engines may skip your content")
-        print(f"{'─'*62}")
+        lines.append(f"\n{'─'*62}")
+        lines.append(f"  MISSING SIGNALS  — AI engines may skip your content")
+        lines.append(f"{'─'*62}")
         # Sort by weight descending (highest impact first)
         for name, signal in sorted(failed, key=lambda x: x[1]["weight"], reverse=True):
-            print(f"  ❌ {name}  (impact: {signal['weight']}pts)")
-            print(f"     → {signal['why']}")
+            lines.append(f"  ❌ {name}  (impact: {signal['weight']}pts)")
+            lines.append(f"     → {signal['why']}")
 
-    print(f"\n{'─'*62}")
-    print(f"  WHAT THIS MEANS FOR AI SEARCH")
-    print(f"{'─'*62}")
+    lines.append(f"\n{'─'*62}")
+    lines.append(f"  WHAT THIS MEANS FOR AI SEARCH")
+    lines.append(f"{'─'*62}")
     if score >= 75:
-        print(f"  Your site is well-positioned to be cited by ChatGPT,")
-        print(f"  Perplexity, Copilot, and Gemini. Keep it maintained.")
+        lines.append(f"  Your site is well-positioned to be cited by ChatGPT,")
+        lines.append(f"  Perplexity, Copilot, and Gemini. Keep it maintained.")
     elif score >= 50:
-        print(f"  AI engines can find your site but may skip it in favor")
-        print(f"  of better-structured competitors. Fix the ❌ signals above.")
+        lines.append(f"  AI engines can find your site but may skip it in favor")
+        lines.append(f"  of better-structured competitors. Fix the ❌ signals above.")
     else:
-        print(f"  AI search engines will likely ignore your content entirely.")
-        print(f"  Your competitors with better structure will be cited instead.")
+        lines.append(f"  AI search engines will likely ignore your content entirely.")
+        lines.append(f"  Your competitors with better structure will be cited instead.")
+
+    lines.append(f"\n{'='*62}")
+    lines.append(f"  📊 Get your full AI SEO audit:")
+    lines.append(f"  → Schema errors, content structure analysis, AI readiness")
+    lines.append(f"     score breakdown, and competitor comparison")
+    lines.append(f"  👉  https://aiseoscan.dev")
+    lines.append(f"{'='*62}\n")
+
+    return "\n".join(lines) + "\n"
+
+
+def print_report(results: dict):
+    # One write instead of a print() per line
+    sys.stdout.write(format_report(results))
+
+
+def run_batch(path: str):
+    with open(path) as f:
+        lines = [line.strip() for line in f]
+    # Drop comments and repeats: the whole list is submitted at once, before the
+    # cache could serve a repeated domain, so each would be fetched again
+    domains = list(dict.fromkeys(line for line in lines if line and not line.startswith("#")))
 
-    print(f"\n{'='*62}")
-    print(f"  📊 Get your full AI SEO audit:")
-    print(f"  → Schema errors, content structure analysis, AI readiness")
-    print(f"     score breakdown, and competitor comparison")
-    print(f"  👉  https://aiseoscan.dev")
-    print(f"{'='*62}\n")
+    print(f"\n⏳ Analyzing AI SEO readiness for {len(domains)} domains...")
+    print("   Checking signals used by ChatGPT, Perplexity, Copilot & Gemini...\n")
+
+    failed = 0
+    for domain, results in analyze_batch(domains):
+        if isinstance(results, Exception):
+            print(f"  ❌ {results}")
+            failed += 1
+        else:
+            print_report(results)
+
+    if failed:
+        sys.exit(1)
 
 
 def main():
-    if len(sys.argv) < 2:
+    if len(sys.argv) < 2 or (sys.argv[1] == "--batch" and len(sys.argv) < 3):
         print("Usage: python ai_seo_checker.py <domain>")
+        print("       python ai_seo_checker.py --batch <file with one domain per line>")
         print("Example: python ai_seo_checker.py myblog.com")
         sys.exit(1)
 
+    if sys.argv[1] == "--batch":
+        run_batch(sys.argv[2])
+        return
+
     domain = sys.argv[1]
     print(f"\n⏳ Analyzing AI SEO readiness for {domain}...")
     print("   Checking signals used by ChatGPT, Perplexity, Copilot & Gemini...\n")
 
-    results = analyze_site(domain)
+    try:
+        results = analyze_site(domain)
+    except ConnectionError as e:
+        print(f"  ❌ {e}")
+        sys.exit(1)
     print_report(results)
 
 